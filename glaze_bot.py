@@ -1,36 +1,41 @@
 from __future__ import annotations
 
 import os
-import json
 import uuid
+import bisect
+import heapq
+import itertools
 import base64
-import threading
+import hashlib
+import functools
+import time
 import asyncio
 import random
+import signal
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
-import requests
+import aiohttp
+from aiohttp import web
 import discord
+import orjson
 from discord import app_commands
-from discord.ext import tasks
-from flask import Flask
 from zoneinfo import ZoneInfo
 
 
 # =========================================================
-# Flask keep-alive (Render)
+# Keep-alive (Render) — served on the bot's own event loop
 # =========================================================
-app = Flask("glaze")
+async def home(_request: web.Request) -> web.Response:
+    return web.Response(text="🍯 Glaze is alive")
 
-@app.get("/")
-def home():
-    return "🍯 Glaze is alive"
-
-def _run_flask():
-    app.run(host="0.0.0.0", port=int(os.getenv("PORT", "8080")))
-
-threading.Thread(target=_run_flask, daemon=True).start()
+async def start_keepalive() -> web.AppRunner:
+    app = web.Application()
+    app.router.add_get("/", home)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", int(os.getenv("PORT", "8080"))).start()
+    return runner
 
 
 # =========================================================
@@ -40,6 +45,7 @@ TOKEN = os.getenv("TOKEN")
 GITHUB_REPO = os.getenv("GITHUB_REPO")
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 GITHUB_FILE = os.getenv("GLAZE_GITHUB_FILE", "glaze_data.json")
+GITHUB_SHARD_DIR = os.getenv("GLAZE_GITHUB_SHARD_DIR", GITHUB_FILE.rsplit(".", 1)[0] + "_glazes")
 
 API_BASE = "https://api.github.com"
 HEADERS = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
@@ -64,6 +70,22 @@ NOT_YOUR_MENU = "🍯 Hands off — this glaze menu isn’t yours!"
 
 GLAZE_DISABLED_MSG = "🍯 Glaze has been switched off by the admins. Try again later."
 
+DECLINE_DM = (
+    "⚠️ Your glaze was **flagged as inappropriate** and wasn’t approved.\n\n"
+    "Please remember to be kind and keep glazes **SFW**. 🍯"
+)
+SCOLD_DM = (
+    "⚠️ **Your glaze was reported and removed**\n\n"
+    "🍯 **Reported glaze:**\n"
+    "“{text}”\n\n"
+    "Please remember to keep glazes kind and SFW."
+)
+THANKS_DM = (
+    "💐 Someone wants to thank you for your glaze!\n\n"
+    "🍯 **Your glaze:**\n“{text}”\n\n"
+)
+THANKS_DM_NOTE = "💬 **Their message:**\n“{note}”"
+
 MONTHLY_GIF_URL = "https://cdn.discordapp.com/attachments/1450977394948051015/IMG_5594.gif"
 
 LOCK_GUILD_ID = int(os.getenv("GUILD_ID", "0"))
@@ -79,23 +101,74 @@ class GlazeBot(discord.Client):
     def __init__(self):
         super().__init__(intents=intents)
         self.tree = app_commands.CommandTree(self)
+        self.keepalive: Optional[web.AppRunner] = None
+        self.flusher: Optional[asyncio.Task] = None
+        self.scheduler: Optional[asyncio.Task] = None
+        self._closing = False
+        self._close_task: Optional[asyncio.Task] = None
 
     async def setup_hook(self):
+        global _http
+        self.keepalive = await start_keepalive()
+
+        # Render stops the bot with SIGTERM, which bot.run doesn't handle;
+        # route it through close() so the final flush still happens
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, self._on_sigterm)
+        except NotImplementedError:
+            pass  # e.g. Windows; Ctrl+C still goes through bot.run
+
+        # one pooled session for all GitHub store I/O (keep-alive + TLS reuse)
+        _http = aiohttp.ClientSession(
+            headers=HEADERS,
+            connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(connect=10, total=30)
+        )
+
+        # deserialize the store once up front; commands then read it from memory
+        try:
+            await load_data()
+        except Exception as e:
+            print("Store preload error:", repr(e))  # first command retries the load
+
         await self.tree.sync()
 
-        # ✅ restore approval buttons for pending approvals (so old messages still work after restart)
+        # ✅ approval buttons on any message (old ones too, after a restart) route here by custom_id
+        self.add_dynamic_items(ApproveButton, DeclineButton)
+
+        self.scheduler = asyncio.create_task(glaze_scheduler())
+        self.flusher = asyncio.create_task(store_flusher())
+
+    def _on_sigterm(self):
+        self._close_task = asyncio.create_task(self.close())
+
+    async def close(self):
+        # SIGTERM and bot.run's own teardown can both land here
+        if self._closing:
+            return await super().close()
+        self._closing = True
+
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+        if self.flusher is not None:
+            # an in-flight flush is shielded, so this only stops the wait loop
+            self.flusher.cancel()
+            await asyncio.gather(self.flusher, return_exceptions=True)
+        if _early_flush is not None:
+            await asyncio.gather(_early_flush, return_exceptions=True)
+
+        # persist anything still pending before the session goes away
+        # (waits on _flush_lock for a shielded flush that's still running)
         try:
-            data, _ = await load_data()
-            for g in data.get("glazes", []):
-                if g.get("approval_status") == "pending":
-                    msg = g.get("approval_message") or {}
-                    mid = msg.get("message_id")
-                    if mid:
-                        bot.add_view(ApprovalView(g["id"]), message_id=int(mid))
+            await flush_data()
         except Exception as e:
-            print("Approval restore error:", repr(e))
+            print("Final flush error:", repr(e))
 
-        glaze_scheduler.start()
+        if _http is not None and not _http.closed:
+            await _http.close()
+        if self.keepalive is not None:
+            await self.keepalive.cleanup()
+        await super().close()
 
     async def on_ready(self):
         print(f"🍯 Glaze online as {self.user}")
@@ -106,128 +179,457 @@ bot = GlazeBot()
 # =========================================================
 # GitHub JSON Store
 # =========================================================
-DEFAULT_DATA: Dict[str, Any] = {
-    "config": {
-        "drop_channel_id": None,
-        "report_channel_id": None,
-        "admin_role_ids": [],
-        # NEW:
-        # daily_drop_limit can be an int OR the literal string "all"
-        "daily_drop_limit": 1,
-        "daily_drop_hour": DEFAULT_DAILY_DROP_HOUR,
-        "daily_drop_minute": DEFAULT_DAILY_DROP_MINUTE,
-        "cooldown_hours": 12,
-        "enabled": True,
-        "approvals_enabled": False,
-        "approval_channel_id": None,
-    },
-    "meta": {
-        "last_daily_drop_date": None,
-        "last_monthly_announce": {}
-    },
-    "cooldowns": {},
-    "glazes": [],
-    "wins": {}
-}
+# store template — a literal, so every call is a fresh dict with nothing to copy
+def _fresh_defaults() -> Dict[str, Any]:
+    return {
+        "config": {
+            "drop_channel_id": None,
+            "report_channel_id": None,
+            "admin_role_ids": [],
+            # NEW:
+            # daily_drop_limit can be an int OR the literal string "all"
+            "daily_drop_limit": 1,
+            "daily_drop_hour": DEFAULT_DAILY_DROP_HOUR,
+            "daily_drop_minute": DEFAULT_DAILY_DROP_MINUTE,
+            "cooldown_hours": 12,
+            "enabled": True,
+            "approvals_enabled": False,
+            "approval_channel_id": None,
+        },
+        "meta": {
+            "last_daily_drop_date": None,
+            "last_monthly_announce": {}
+        },
+        "cooldowns": {},
+        "glazes": [],
+        "wins": {}
+    }
 
 _store_lock = asyncio.Lock()
 _cached_data: Optional[Dict[str, Any]] = None
-_cached_sha: Optional[str] = None
+
+# Glazes are stored one file per month under GITHUB_SHARD_DIR, cooldowns in
+# their own file there; GITHUB_FILE keeps config/meta/wins plus the list of
+# shard months. A save only PUTs the files whose bytes actually changed, so a
+# new glaze uploads the current month + cooldowns, not the whole history, and
+# the small config file only when settings/meta change.
+# path -> blob sha on GitHub (also: skip PUTs that wouldn't change the file)
+_file_sha: Dict[str, str] = {}
+# path -> ETag of the last GET, so refreshes are a cheap 304 when nothing changed
+_file_etag: Dict[str, str] = {}
+# shard months listed in the main file at the last load
+_shard_months: List[str] = []
+
+# created in GlazeBot.setup_hook (bot.http is discord.py's own client)
+_http: Optional[aiohttp.ClientSession] = None
 
 
 def _github_enabled() -> bool:
     return bool(GITHUB_REPO and GITHUB_TOKEN)
 
 
-def _deepcopy(data):
-    return json.loads(json.dumps(data))
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+# file body as-is: no JSON envelope / base64, and works past the 1 MB contents limit
+RAW_ACCEPT = {"Accept": "application/vnd.github.raw"}
+GITHUB_RETRY_STATUSES = (502, 503, 504)
+GITHUB_MAX_RETRIES = 3
 
 
-def _merge_defaults(data: Dict[str, Any]) -> Dict[str, Any]:
-    merged = _deepcopy(DEFAULT_DATA)
-    for k, v in data.items():
-        if isinstance(v, dict) and isinstance(merged.get(k), dict):
-            merged[k].update(v)
+async def _github_request(method: str, url: str, raw: bool = False, **kwargs) -> Tuple[int, Any, Optional[str]]:
+    # retries transient gateway errors / dropped connections with backoff
+    for attempt in range(GITHUB_MAX_RETRIES + 1):
+        last_try = attempt == GITHUB_MAX_RETRIES
+        try:
+            async with _http.request(method, url, **kwargs) as r:
+                if r.status not in GITHUB_RETRY_STATUSES or last_try:
+                    if r.status in (200, 201):
+                        body = await r.read() if raw else await r.json()
+                    else:
+                        body = await r.text()
+                    return r.status, body, r.headers.get("ETag")
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last_try:
+                raise
+        await asyncio.sleep(0.5 * (2 ** attempt))
+    raise RuntimeError("unreachable")
+
+
+# the blob sha GitHub wants on PUT, computed the same way git does
+def _git_blob_sha(raw: bytes) -> str:
+    return hashlib.sha1(b"blob %d\0" % len(raw) + raw).hexdigest()
+
+def _contents_url(path: str) -> str:
+    return f"{API_BASE}/repos/{GITHUB_REPO}/contents/{path}"
+
+def _shard_path(month_key_str: str) -> str:
+    return f"{GITHUB_SHARD_DIR}/{month_key_str}.json"
+
+def _cooldowns_path() -> str:
+    return f"{GITHUB_SHARD_DIR}/cooldowns.json"
+
+def _shard_key(g: Dict[str, Any]) -> str:
+    return g.get("month_key") or "undated"
+
+
+async def _fetch_file(path: str, conditional: bool = False) -> Tuple[int, Optional[bytes]]:
+    # (200, bytes) | (304, None) | (404, None)
+    headers = dict(RAW_ACCEPT)
+    if conditional and path in _file_etag:
+        headers["If-None-Match"] = _file_etag[path]
+
+    status, body, etag = await _github_request("GET", _contents_url(path), raw=True, headers=headers)
+    if status == 200:
+        _file_sha[path] = _git_blob_sha(body)
+        if etag:
+            _file_etag[path] = etag
+        return status, body
+    if status in (304, 404):
+        return status, None
+    raise RuntimeError(body)
+
+
+# the file's current bytes on GitHub (None if it doesn't exist); unlike
+# _fetch_file this doesn't record the sha, so it can't license an overwrite
+async def _fetch_remote(path: str) -> Optional[bytes]:
+    status, body, _ = await _github_request("GET", _contents_url(path), raw=True, headers=RAW_ACCEPT)
+    if status == 200:
+        return body
+    if status == 404:
+        return None
+    raise RuntimeError(body)
+
+# whether our shard/cooldowns file only adds to the remote one (every remote
+# glaze id / cooldown member is still in ours), i.e. GitHub holds what an
+# interrupted migration wrote rather than somebody else's changes
+def _extends_remote(content: bytes, remote: bytes) -> bool:
+    ours, theirs = orjson.loads(content), orjson.loads(remote)
+    if isinstance(ours, list) and isinstance(theirs, list):
+        ids = {g.get("id") for g in ours}
+        return all(g.get("id") in ids for g in theirs)
+    if isinstance(ours, dict) and isinstance(theirs, dict):
+        return theirs.keys() <= ours.keys()
+    return False
+
+
+async def _put_file(path: str, content: bytes, message: str) -> None:
+    blob_sha = _git_blob_sha(content)
+    if _file_sha.get(path) == blob_sha:
+        return  # GitHub already has exactly these bytes
+
+    payload = {
+        "message": message,
+        "content": base64.b64encode(content).decode()
+    }
+    if path in _file_sha:
+        payload["sha"] = _file_sha[path]
+
+    # pre-encoded so the request body isn't serialized a second time by aiohttp
+    status, res, _ = await _github_request("PUT", _contents_url(path), data=orjson.dumps(payload), headers=JSON_CONTENT_TYPE)
+
+    if status in (409, 422):
+        # our sha is stale. Only two cases are safe to resolve here: GitHub
+        # already has our bytes (a retried PUT whose first attempt landed), or
+        # a shard/cooldowns file with no recorded sha that ours only extends
+        # (an interrupted migration). Anything else is a real conflict.
+        remote = await _fetch_remote(path)
+        if remote is not None and _git_blob_sha(remote) == blob_sha:
+            _file_sha[path] = blob_sha
+            _file_etag.pop(path, None)
+            return
+
+        if remote is not None and "sha" not in payload and path != GITHUB_FILE and _extends_remote(content, remote):
+            payload["sha"] = _git_blob_sha(remote)
+            status, res, _ = await _github_request("PUT", _contents_url(path), data=orjson.dumps(payload), headers=JSON_CONTENT_TYPE)
         else:
-            merged[k] = v
-    return merged
+            # stay dirty (the flusher backs off) rather than clobber the edit
+            raise RuntimeError(
+                f"{path} changed on GitHub since it was loaded; not overwriting it. "
+                "An admin must run /glazerefresh discard_unsaved:True to reload GitHub's copy "
+                "(the bot's unsaved changes are dropped)"
+            )
 
-async def load_data() -> Tuple[Dict[str, Any], Optional[str]]:
-    global _cached_data, _cached_sha
+    if status not in (200, 201):
+        raise RuntimeError(res)
 
-    need_create = False
-    created_data: Optional[Dict[str, Any]] = None
+    _file_sha[path] = res["content"]["sha"]
+    _file_etag.pop(path, None)  # the file changed; next GET fetches it in full
 
-    async with _store_lock:
-        if _cached_data is not None:
-            return _cached_data, _cached_sha
 
-        if not _github_enabled():
-            _cached_data = _deepcopy(DEFAULT_DATA)
-            return _cached_data, None
+# sections that live in their own files rather than in GITHUB_FILE
+_SPLIT_SECTIONS = ("glazes", "cooldowns")
 
-        url = f"{API_BASE}/repos/{GITHUB_REPO}/contents/{GITHUB_FILE}"
-        r = await asyncio.to_thread(requests.get, url, headers=HEADERS)
+# path -> file bytes: one file per month of glazes, cooldowns, the rest in GITHUB_FILE
+def _encode_store(data: Dict[str, Any]) -> Dict[str, bytes]:
+    shards: Dict[str, List[Dict[str, Any]]] = {}
+    for g in data["glazes"]:
+        shards.setdefault(_shard_key(g), []).append(g)
 
-        if r.status_code == 200:
-            payload = r.json()
-            raw = base64.b64decode(payload["content"]).decode()
-            _cached_sha = payload["sha"]
-            _cached_data = _merge_defaults(json.loads(raw))
-            return _cached_data, _cached_sha
+    main = {k: v for k, v in data.items() if k not in _SPLIT_SECTIONS}
+    main["glaze_shards"] = sorted(shards)
 
-        if r.status_code == 404:
-            created_data = _deepcopy(DEFAULT_DATA)
-            _cached_data = created_data
-            _cached_sha = None
-            need_create = True
+    files = {_shard_path(mk): orjson.dumps(glz) for mk, glz in sorted(shards.items())}
+    files[_cooldowns_path()] = orjson.dumps(data["cooldowns"], option=orjson.OPT_NON_STR_KEYS)
+    files[GITHUB_FILE] = orjson.dumps(main, option=orjson.OPT_NON_STR_KEYS)  # last, so it never lists a shard that isn't there yet
+    return files
 
-        else:
-            raise RuntimeError(r.text)
 
-    # IMPORTANT: save OUTSIDE the lock
-    if need_create and created_data is not None:
-        await save_data(created_data, None, "Create glaze_data.json")
-        return created_data, None
+_CONFIG_CHANNEL_KEYS = ("drop_channel_id", "report_channel_id", "approval_channel_id")
 
-    # fallback (shouldn't hit)
-    return _cached_data or _deepcopy(DEFAULT_DATA), _cached_sha
+# fills in missing keys in place; the loaded sections are kept, not copied
+def _merge_defaults(merged: Dict[str, Any]) -> Dict[str, Any]:
+    for k, v in _fresh_defaults().items():
+        cur = merged.setdefault(k, v)
+        if cur is not v and isinstance(v, dict) and isinstance(cur, dict):
+            for kk, vv in v.items():
+                cur.setdefault(kk, vv)
+
+    # member ids are ints in memory; JSON object keys only become strings on save
+    merged["cooldowns"] = {int(uid): ts for uid, ts in merged["cooldowns"].items()}
+    merged["wins"] = {int(uid): int(n) for uid, n in merged["wins"].items()}
+
+    # same for configured channel/role ids, in case the JSON was hand-edited with strings
+    cfg = merged["config"]
+    for key in _CONFIG_CHANNEL_KEYS:
+        if cfg.get(key):
+            cfg[key] = int(cfg[key])
+    cfg["admin_role_ids"] = [int(r) for r in cfg.get("admin_role_ids") or ()]
+
+    for g in merged["glazes"]:
+        g["sender_id"] = int(g["sender_id"])
+        g["recipient_id"] = int(g["recipient_id"])
+        # backfill epoch timestamps for glazes stored before created_at_ts existed
+        if "created_at_ts" not in g:
+            g["created_at_ts"] = int(parse_iso(g["created_at"]).timestamp()) if g.get("created_at") else 0
+    return merged
 
+# the store (served from memory once loaded); writes go through mark_dirty()
+async def load_data(refresh: bool = False) -> Dict[str, Any]:
+    global _cached_data, _shard_months
 
-async def save_data(data: Dict[str, Any], sha: Optional[str], message: str):
-    global _cached_data, _cached_sha
+    # fast path: cache hits are pure memory reads, no lock needed
+    if _cached_data is not None and not refresh:
+        return _cached_data
+
+    pending_save: Optional[Tuple[Dict[str, Any], str]] = None
 
     async with _store_lock:
+        # refresh re-reads GitHub (manual JSON edits) — but never over unflushed changes
+        want_refresh = refresh and _github_enabled() and not _dirty.is_set()
+
+        # re-check: another task may have filled the cache while we waited
+        if _cached_data is not None and not want_refresh:
+            return _cached_data
+
         if not _github_enabled():
-            _cached_data = _deepcopy(data)
-            _cached_sha = sha
-            return
+            _cached_data = _fresh_defaults()
+            return _cached_data
+
+        # the old cache stays in place, so lock-free readers aren't
+        # queued behind these GETs while a refresh is in flight
+        old = _cached_data
+        conditional = old is not None
+        status, body = await _fetch_file(GITHUB_FILE, conditional)
+
+        if status == 404:
+            # only a brand-new store: if the split files exist, the main file
+            # went missing and a fresh store would shadow (and later clobber) them
+            c_status, _ = await _fetch_file(_cooldowns_path())
+            if c_status != 404:
+                raise RuntimeError(f"{GITHUB_FILE} is missing on GitHub but {_cooldowns_path()} exists")
+            _cached_data = _fresh_defaults()
+            _shard_months = []
+            pending_save = (_cached_data, "Create glaze_data.json")
+
+        else:
+            main = orjson.loads(body) if body is not None else None
+            months = main.pop("glaze_shards", []) if main is not None else _shard_months
+
+            *shard_results, (c_status, c_body) = await asyncio.gather(
+                *(_fetch_file(_shard_path(mk), conditional) for mk in months),
+                _fetch_file(_cooldowns_path(), conditional)
+            )
+
+            changed = main is not None
+            glazes: List[Dict[str, Any]] = []
+            for mk, (s_status, s_body) in zip(months, shard_results):
+                if s_body is not None:
+                    glazes.extend(orjson.loads(s_body))
+                    changed = True
+                elif s_status == 304:
+                    glazes.extend(glazes_in_month(old, mk))
+                else:
+                    # a partial store would drop this month from glaze_shards
+                    # on the next save and orphan the file for good
+                    raise RuntimeError(f"Glaze shard {_shard_path(mk)} is listed in {GITHUB_FILE} but missing on GitHub")
+
+            cooldowns = None  # 404: not split out of the main file yet
+            if c_body is not None:
+                cooldowns = orjson.loads(c_body)
+                changed = True
+            elif c_status == 304:
+                cooldowns = old["cooldowns"]
+
+            if old is not None and (not changed or _dirty.is_set()):
+                # unchanged on GitHub, or a handler changed the cached store
+                # meanwhile (don't clobber it)
+                return old
+
+            if main is None:
+                main = {k: v for k, v in old.items() if k not in _SPLIT_SECTIONS}
+            # a store from before the split still has these inline in the main file
+            migrate = any(k in main for k in _SPLIT_SECTIONS)
+            if "glazes" not in main:
+                main["glazes"] = glazes
+            if "cooldowns" not in main and cooldowns is not None:
+                main["cooldowns"] = cooldowns
+
+            _cached_data = _merge_defaults(main)
+            _shard_months = months
+            if migrate:
+                pending_save = (_cached_data, "Split glaze store into separate files")
+
+    # IMPORTANT: save OUTSIDE the lock
+    if pending_save:
+        await save_data(*pending_save)
+
+    return _cached_data
 
-        payload = {
-            "message": message,
-            "content": base64.b64encode(json.dumps(data, indent=2).encode()).decode()
-        }
-        if sha:
-            payload["sha"] = sha
 
-        url = f"{API_BASE}/repos/{GITHUB_REPO}/contents/{GITHUB_FILE}"
-        r = await asyncio.to_thread(requests.put, url, headers=HEADERS, json=payload)
+async def save_data(data: Dict[str, Any], message: str):
+    global _cached_data, _shard_months
+
+    if not _github_enabled():
+        _cached_data = data
+        return
 
-        if r.status_code not in (200, 201):
-            raise RuntimeError(r.text)
+    # encode outside the lock; only the PUTs + cache swap are serialized
+    files = _encode_store(data)
 
-        res = r.json()
-        _cached_sha = res["content"]["sha"]
-        _cached_data = _deepcopy(data)
+    async with _store_lock:
+        for path, content in files.items():
+            await _put_file(path, content, message)
+
+        _cached_data = data
+        _shard_months = sorted({_shard_key(g) for g in data["glazes"]})
+
+
+# ---------------------------------------------------------
+# Write-behind: handlers mutate the cached dict in place and
+# call mark_dirty(); store_flusher wakes on the first change and
+# PUTs once things go quiet for STORE_FLUSH_QUIET_SECONDS (at most
+# STORE_FLUSH_SECONDS after that first change), or straight away
+# once enough changes have piled up.
+# ---------------------------------------------------------
+STORE_FLUSH_QUIET_SECONDS = 2
+STORE_FLUSH_SECONDS = 10
+STORE_FLUSH_MAX_PENDING = 20
+# after a failed flush, retries back off exponentially up to this
+STORE_FLUSH_MAX_BACKOFF = 300
+
+_dirty = asyncio.Event()
+# message -> count of the changes waiting for the next flush (insertion ordered)
+_dirty_messages: Dict[str, int] = {}
+_flush_lock = asyncio.Lock()
+_pending_writes = 0
+_early_flush: Optional[asyncio.Task] = None
+# consecutive failed flushes; >0 means we're backing off
+_flush_failures = 0
+
+
+# bumped on every mutation so derived views (e.g. glazes_for_recipient) can tell they're stale
+_store_generation = 0
+
+
+def mark_dirty(message: str) -> None:
+    global _store_generation, _pending_writes, _early_flush
+    _dirty_messages[message] = _dirty_messages.get(message, 0) + 1
+    _store_generation += 1
+    _pending_writes += 1
+    _dirty.set()
+
+    if (_pending_writes >= STORE_FLUSH_MAX_PENDING and not _flush_failures
+            and (_early_flush is None or _early_flush.done())):
+        _early_flush = asyncio.create_task(_flush_logged())
+
+
+# one commit per flush, e.g. "Approve glaze (x3); Delete glaze (mod action)"
+def _batch_message(batch: Dict[str, int]) -> str:
+    parts = [msg if n == 1 else f"{msg} (x{n})" for msg, n in batch.items()]
+    return "; ".join(parts) or "Update glaze data"
+
+
+async def flush_data():
+    global _pending_writes
+    async with _flush_lock:
+        if not _dirty.is_set() or _cached_data is None:
+            return
+        _dirty.clear()
+        _pending_writes = 0
+        batch = dict(_dirty_messages)
+        _dirty_messages.clear()
+        try:
+            await save_data(_cached_data, message=_batch_message(batch))
+        except BaseException:
+            # retry on the next tick (or the final flush, if this was
+            # cancelled), still crediting these changes
+            for msg, n in batch.items():
+                _dirty_messages[msg] = _dirty_messages.get(msg, 0) + n
+            _dirty.set()
+            raise
+
+
+# drops unsaved changes (after a manual GitHub edit the admin wants to keep)
+# and forgets the ETags, so the next refresh re-reads every file in full
+async def discard_pending() -> None:
+    global _pending_writes
+    async with _flush_lock:
+        _dirty.clear()
+        _dirty_messages.clear()
+        _pending_writes = 0
+        _file_etag.clear()
+
+
+# logs the first failure of a streak and the recovery, not every retry
+async def _flush_logged() -> bool:
+    global _flush_failures
+    try:
+        await flush_data()
+    except Exception as e:
+        _flush_failures += 1
+        if _flush_failures == 1:
+            print("Store flush error (retrying with backoff):", repr(e))
+        return False
+    if _flush_failures:
+        print(f"Store flush recovered after {_flush_failures} failed attempt(s)")
+        _flush_failures = 0
+    return True
+
+
+async def store_flusher():
+    # sleeps until something is marked dirty, then lets changes batch up
+    loop = asyncio.get_running_loop()
+    while True:
+        await _dirty.wait()
+        deadline = loop.time() + STORE_FLUSH_SECONDS
+        while True:
+            seen = _store_generation
+            await asyncio.sleep(min(STORE_FLUSH_QUIET_SECONDS, max(0.0, deadline - loop.time())))
+            # debounce, but don't let a steady trickle of changes hold the write forever
+            if _store_generation == seen or loop.time() >= deadline:
+                break
+        # shielded: cancelling the flusher (shutdown) must not abort a save
+        # halfway through its PUTs
+        if not await asyncio.shield(_flush_logged()):
+            await asyncio.sleep(min(STORE_FLUSH_MAX_BACKOFF, STORE_FLUSH_QUIET_SECONDS * 2 ** _flush_failures))
 
 
 # =========================================================
 # Helpers
 # =========================================================
 
-def _get_cooldown_td(data: Dict[str, Any]) -> timedelta:
+def _parse_cooldown_td(cfg: Dict[str, Any]) -> timedelta:
     try:
-        hours = int(data.get("config", {}).get("cooldown_hours", 12))
+        hours = int(cfg.get("cooldown_hours", 12))
     except Exception:
         hours = 12
     hours = max(1, min(168, hours))  # 1h to 7 days
@@ -237,17 +639,180 @@ def now_utc():
     return datetime.now(timezone.utc)
 
 def iso_utc(dt):
+    if dt.tzinfo is timezone.utc:
+        return dt.isoformat()
     return dt.astimezone(timezone.utc).isoformat()
 
 def parse_iso(s):
     return datetime.fromisoformat(s)
 
+# epoch seconds for an ISO string (cooldown stamps repeat per sender, so memoize)
+@functools.lru_cache(maxsize=1024)
+def iso_ts(s: str) -> float:
+    return parse_iso(s).timestamp()
+
 def month_key(dt):
-    return dt.strftime("%Y-%m")
+    return f"{dt.year:04d}-{dt.month:02d}"
+
+# London display date for a glaze's created_at_ts; timestamps never change, so it's memoized
+@functools.lru_cache(maxsize=4096)
+def fmt_london_date(ts: int) -> str:
+    return datetime.fromtimestamp(ts, LONDON).strftime("%d %b %Y")
+
+
+# Indexes over data["glazes"]: id -> glaze, recipient -> glazes (oldest
+# first), month -> glazes, plus running tallies of *visible* (approved, not
+# deleted) glazes per sender and per month/recipient. Glazes are only ever
+# appended (deletes are soft), so new entries are indexed incrementally and
+# everything is rebuilt whenever the cached store is swapped for a new one.
+# Visibility changes on existing glazes go through note_visibility_change().
+# Undropped visible glazes also sit in a min-heap on created_at; entries that
+# get dropped/deleted are discarded lazily when they reach the top.
+_glaze_by_id: Dict[str, Dict[str, Any]] = {}
+_glazes_by_recipient: Dict[int, List[Dict[str, Any]]] = {}
+_glazes_by_month: Dict[str, List[Dict[str, Any]]] = {}
+_sender_counts: Dict[int, int] = {}
+_month_recipient_counts: Dict[str, Dict[int, int]] = {}
+_pending_heap: List[Tuple[int, str, Dict[str, Any]]] = []
+_indexed_glazes: Optional[List[Dict[str, Any]]] = None
+_indexed_count = 0
+
+_visible_by_recipient: Dict[int, List[Dict[str, Any]]] = {}
+_visible_generation = -1
+
+def _created_key(g: Dict[str, Any]) -> int:
+    return g.get("created_at_ts", 0)
+
+def is_visible(g: Dict[str, Any]) -> bool:
+    return bool(g.get("approved")) and not g.get("deleted")
+
+def is_pending(g: Dict[str, Any]) -> bool:
+    return is_visible(g) and not g.get("dropped_at")
+
+def _push_pending(g: Dict[str, Any]) -> None:
+    heapq.heappush(_pending_heap, (_created_key(g), g["id"], g))
+
+def _bump(counts: Dict[int, int], key: int, delta: int) -> None:
+    n = counts.get(key, 0) + delta
+    if n > 0:
+        counts[key] = n
+    else:
+        counts.pop(key, None)
 
+def _tally(g: Dict[str, Any], delta: int) -> None:
+    _bump(_sender_counts, g["sender_id"], delta)
+    month = _month_recipient_counts.setdefault(g.get("month_key"), {})
+    _bump(month, g["recipient_id"], delta)
 
-def _get_daily_drop_settings(data: Dict[str, Any]) -> Tuple[int, int, Union[int, str]]:
-    cfg = data.get("config", {})
+def note_visibility_change(g: Dict[str, Any], was_visible: bool) -> None:
+    # only tally glazes from the store currently indexed (a swap rebuilds anyway)
+    if _glaze_by_id.get(g["id"]) is not g:
+        return
+    now_visible = is_visible(g)
+    if now_visible != was_visible:
+        _tally(g, 1 if now_visible else -1)
+        if is_pending(g):
+            _push_pending(g)
+
+def _index_one(g: Dict[str, Any]) -> None:
+    _glaze_by_id[g["id"]] = g
+    _glazes_by_month.setdefault(_shard_key(g), []).append(g)
+    if is_visible(g):
+        _tally(g, 1)
+        if not g.get("dropped_at"):
+            _push_pending(g)
+
+def _sync_glaze_index(data: Dict[str, Any]) -> None:
+    global _indexed_glazes, _indexed_count
+    glazes = data["glazes"]
+
+    if len(glazes) != _indexed_count or glazes is not _indexed_glazes:
+        _visible_by_recipient.clear()
+
+    if glazes is not _indexed_glazes or len(glazes) < _indexed_count:
+        _glaze_by_id.clear()
+        _glazes_by_recipient.clear()
+        _glazes_by_month.clear()
+        _sender_counts.clear()
+        _month_recipient_counts.clear()
+        _pending_heap.clear()
+        for g in glazes:
+            _index_one(g)
+            _glazes_by_recipient.setdefault(g["recipient_id"], []).append(g)
+        for bucket in _glazes_by_recipient.values():
+            bucket.sort(key=_created_key)
+        _indexed_glazes = glazes
+    else:
+        for g in glazes[_indexed_count:]:
+            _index_one(g)
+            bucket = _glazes_by_recipient.setdefault(g["recipient_id"], [])
+            bisect.insort(bucket, g, key=_created_key)
+
+    _indexed_count = len(glazes)
+
+def find_glaze(data: Dict[str, Any], glaze_id: str) -> Optional[Dict[str, Any]]:
+    _sync_glaze_index(data)
+    return _glaze_by_id.get(glaze_id)
+
+# visible (approved, not deleted) glazes for a member, newest first.
+# Results are memoized until the next mutation (store generation) or new glaze.
+# Callers must treat the returned list as read-only.
+def glazes_for_recipient(data: Dict[str, Any], user_id: int) -> List[Dict[str, Any]]:
+    global _visible_generation
+    _sync_glaze_index(data)
+    if _visible_generation != _store_generation:
+        _visible_by_recipient.clear()
+        _visible_generation = _store_generation
+
+    glz = _visible_by_recipient.get(user_id)
+    if glz is None:
+        bucket = _glazes_by_recipient.get(user_id, [])
+        glz = [g for g in reversed(bucket) if g.get("approved") and not g.get("deleted")]
+        _visible_by_recipient[user_id] = glz
+    return glz
+
+# the oldest `limit` undropped visible glazes (None = all), oldest first
+def oldest_pending(data: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    _sync_glaze_index(data)
+    out: List[Dict[str, Any]] = []
+    kept = []
+    while _pending_heap and (limit is None or len(out) < limit):
+        entry = heapq.heappop(_pending_heap)
+        if is_pending(entry[2]):
+            out.append(entry[2])
+            kept.append(entry)
+    # the caller marks them dropped; until then they stay queued
+    for entry in kept:
+        heapq.heappush(_pending_heap, entry)
+    return out
+
+# every undropped visible glaze, in no particular order (read-only)
+def pending_glazes(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    _sync_glaze_index(data)
+    return [entry[2] for entry in _pending_heap if is_pending(entry[2])]
+
+# whether a member has any visible glaze; stops at the first one found
+def has_glazes(data: Dict[str, Any], user_id: int) -> bool:
+    _sync_glaze_index(data)
+    return any(is_visible(g) for g in _glazes_by_recipient.get(user_id, ()))
+
+# visible glazes sent per member (read-only)
+def sender_counts(data: Dict[str, Any]) -> Dict[int, int]:
+    _sync_glaze_index(data)
+    return _sender_counts
+
+# visible glazes received per member in a "YYYY-MM" month (read-only)
+def month_recipient_counts(data: Dict[str, Any], month_key_str: str) -> Dict[int, int]:
+    _sync_glaze_index(data)
+    return _month_recipient_counts.get(month_key_str, {})
+
+# every glaze (any state) created in a "YYYY-MM" month, in store order
+def glazes_in_month(data: Dict[str, Any], month_key_str: str) -> List[Dict[str, Any]]:
+    _sync_glaze_index(data)
+    return _glazes_by_month.get(month_key_str, [])
+
+
+def _parse_daily_drop_settings(cfg: Dict[str, Any]) -> Tuple[int, int, Union[int, str]]:
     hour = int(cfg.get("daily_drop_hour", DEFAULT_DAILY_DROP_HOUR) or DEFAULT_DAILY_DROP_HOUR)
     minute = int(cfg.get("daily_drop_minute", DEFAULT_DAILY_DROP_MINUTE) or DEFAULT_DAILY_DROP_MINUTE)
     limit = cfg.get("daily_drop_limit", 1)
@@ -276,12 +841,44 @@ def _get_daily_drop_settings(data: Dict[str, Any]) -> Tuple[int, int, Union[int,
 
     return hour, minute, limit
 
+# parsed config, rebuilt when the config dict is swapped (reload) or
+# invalidated after an in-place edit (controlpanel)
+_cfg_src: Optional[Dict[str, Any]] = None
+_cfg_daily_drop: Tuple[int, int, Union[int, str]] = (DEFAULT_DAILY_DROP_HOUR, DEFAULT_DAILY_DROP_MINUTE, 1)
+_cfg_cooldown_td: timedelta = timedelta(hours=12)
+
+def _refresh_config_cache(data: Dict[str, Any]) -> None:
+    global _cfg_src, _cfg_daily_drop, _cfg_cooldown_td
+    cfg = data.get("config", {})
+    if cfg is not _cfg_src:
+        _cfg_daily_drop = _parse_daily_drop_settings(cfg)
+        _cfg_cooldown_td = _parse_cooldown_td(cfg)
+        _cfg_src = cfg
+
+def invalidate_config_cache() -> None:
+    global _cfg_src, _admin_roles_src
+    _cfg_src = None
+    _admin_roles_src = None
+
+def _get_daily_drop_settings(data: Dict[str, Any]) -> Tuple[int, int, Union[int, str]]:
+    _refresh_config_cache(data)
+    return _cfg_daily_drop
+
+def _get_cooldown_td(data: Dict[str, Any]) -> timedelta:
+    _refresh_config_cache(data)
+    return _cfg_cooldown_td
+
 
 # =========================================================
 # Embed styling
 # =========================================================
 GLAZE_YELLOW = discord.Color.from_rgb(255, 200, 64)
 
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
 
 # =========================================================
 # Embeds
@@ -298,8 +895,8 @@ def build_daily_embed(recipient_display: str, text: str) -> discord.Embed:
 
 def build_monthly_embed(month_key_str: str, winner_mention: str, count: int) -> discord.Embed:
     # month_key_str like "2025-12"
-    dt = datetime.strptime(month_key_str + "-01", "%Y-%m-%d")
-    pretty = dt.strftime("%B %Y")
+    year, month = month_key_str.split("-")
+    pretty = f"{MONTH_NAMES[int(month) - 1]} {year}"
 
     e = discord.Embed(
         title="🍯 MOST GLAZED",
@@ -353,6 +950,49 @@ def build_shared_embed(glaze_text: str, note: str) -> discord.Embed:
 # =========================================================
 # Permissions + Guild helpers
 # =========================================================
+USER_CACHE_TTL = 3600  # seconds
+
+_user_cache: Dict[int, Tuple[float, discord.User]] = {}
+
+async def get_user_cached(user_id: int) -> discord.User:
+    # discord.py's own cache first (no HTTP), then our TTL cache, then REST
+    u = bot.get_user(user_id)
+    if u:
+        return u
+    now = time.monotonic()
+    hit = _user_cache.get(user_id)
+    if hit and now - hit[0] < USER_CACHE_TTL:
+        return hit[1]
+    u = await bot.fetch_user(user_id)
+    _user_cache[user_id] = (now, u)
+    return u
+
+# best-effort DM (closed DMs / unknown users are ignored), so it can run
+# alongside the interaction response instead of in front of it
+async def dm_quietly(user_id: int, text: str) -> None:
+    try:
+        u = await get_user_cached(user_id)
+        await u.send(text)
+    except Exception:
+        pass
+
+DM_CHAR_LIMIT = 2000
+
+# split lines into messages under Discord's length limit
+def chunk_lines(lines: Iterable[str], limit: int = DM_CHAR_LIMIT) -> List[str]:
+    chunks: List[str] = []
+    cur = ""
+    for line in lines:
+        line = line[:limit]
+        if cur and len(cur) + 1 + len(line) > limit:
+            chunks.append(cur)
+            cur = line
+        else:
+            cur = f"{cur}\n{line}" if cur else line
+    if cur:
+        chunks.append(cur)
+    return chunks
+
 async def get_single_guild() -> Optional[discord.Guild]:
     if not bot.guilds:
         return None
@@ -360,65 +1000,82 @@ async def get_single_guild() -> Optional[discord.Guild]:
         return discord.utils.get(bot.guilds, id=LOCK_GUILD_ID)
     return bot.guilds[0]
 
-def is_admin(interaction: discord.Interaction, admin_role_ids: List[int]) -> bool:
+# the configured admin role ids as a frozenset; rebuilt when the list is
+# swapped (reload) or after /controlpanel edits it (invalidate_config_cache)
+_admin_roles_src: Optional[List[int]] = None
+_admin_roles: FrozenSet[int] = frozenset()
+
+def admin_role_set(data: Dict[str, Any]) -> FrozenSet[int]:
+    global _admin_roles_src, _admin_roles
+    ids = data.get("config", {}).get("admin_role_ids")
+    if ids is not _admin_roles_src:
+        _admin_roles = frozenset(ids or ())
+        _admin_roles_src = ids
+    return _admin_roles
+
+def is_admin(interaction: discord.Interaction, admin_role_ids: Iterable[int]) -> bool:
     if not isinstance(interaction.user, discord.Member):
         return False
     member: discord.Member = interaction.user
     if member.guild_permissions.administrator:
         return True
-    roles = {r.id for r in member.roles}
-    return any(rid in roles for rid in admin_role_ids)
-
-async def get_drop_channel(guild: discord.Guild) -> Optional[discord.TextChannel]:
-    data, _ = await load_data()
-    cid = data["config"].get("drop_channel_id")
+    if not isinstance(admin_role_ids, (set, frozenset)):
+        admin_role_ids = set(admin_role_ids)
+    return not admin_role_ids.isdisjoint(r.id for r in member.roles)
+
+# guild.get_channel is a dict lookup on discord.py's gateway cache (no REST),
+# so a configured channel is resolved fresh each time rather than cached here
+async def _config_channel(guild: discord.Guild, data: Optional[Dict[str, Any]], key: str) -> Optional[discord.TextChannel]:
+    if data is None:
+        data = await load_data()
+    cid = data["config"].get(key)
     if not cid:
         return None
-    ch = guild.get_channel(int(cid))
+    ch = guild.get_channel(cid)
     return ch if isinstance(ch, discord.TextChannel) else None
 
-async def get_report_channel(guild: discord.Guild) -> Optional[discord.TextChannel]:
-    data, _ = await load_data()
-    cid = data["config"].get("report_channel_id")
-    if not cid:
-        return None
-    ch = guild.get_channel(int(cid))
-    return ch if isinstance(ch, discord.TextChannel) else None
+async def get_drop_channel(guild: discord.Guild, data: Optional[Dict[str, Any]] = None) -> Optional[discord.TextChannel]:
+    return await _config_channel(guild, data, "drop_channel_id")
 
-async def get_approval_channel(guild: discord.Guild) -> Optional[discord.TextChannel]:
-    data, _ = await load_data()
-    cid = data["config"].get("approval_channel_id")
-    if not cid:
-        return None
-    ch = guild.get_channel(int(cid))
-    return ch if isinstance(ch, discord.TextChannel) else None
+async def get_report_channel(guild: discord.Guild, data: Optional[Dict[str, Any]] = None) -> Optional[discord.TextChannel]:
+    return await _config_channel(guild, data, "report_channel_id")
+
+async def get_approval_channel(guild: discord.Guild, data: Optional[Dict[str, Any]] = None) -> Optional[discord.TextChannel]:
+    return await _config_channel(guild, data, "approval_channel_id")
+
+# =========================================================
+# UI: base for menus only their owner may press
+# =========================================================
+class OwnerOnlyView(discord.ui.View):
+    owner_id: int
+
+    # runs before every button callback; False stops the callback
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message(NOT_YOUR_MENU, ephemeral=True)
+            return False
+        return True
 
 # =========================================================
 # UI: /myglaze hub view
 # =========================================================
-class MyGlazeHubView(discord.ui.View):
+class MyGlazeHubView(OwnerOnlyView):
     def __init__(self, owner_id: int):
         super().__init__(timeout=120)
         self.owner_id = owner_id
 
     @discord.ui.button(label="🍯 My Glazes", style=discord.ButtonStyle.secondary)
     async def my_glazes(self, interaction: discord.Interaction, _button: discord.ui.Button):
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message(NOT_YOUR_MENU, ephemeral=True)
-            return
         await open_my_glazes(interaction)
 
     @discord.ui.button(label="💌 DM Me", style=discord.ButtonStyle.secondary)
     async def dm_me(self, interaction: discord.Interaction, _button: discord.ui.Button):
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message(NOT_YOUR_MENU, ephemeral=True)
-            return
         await send_glaze_mail(interaction)
 
 ###### UI APPROVAL########
 def build_approval_embed(guild: discord.Guild, glaze: Dict[str, Any]) -> discord.Embed:
-    recipient = guild.get_member(int(glaze["recipient_id"]))
-    recipient_txt = recipient.mention if recipient else f"<@{int(glaze['recipient_id'])}>"
+    recipient = guild.get_member(glaze["recipient_id"])
+    recipient_txt = recipient.mention if recipient else f"<@{glaze['recipient_id']}>"
 
     e = discord.Embed(
         title="🛂 Glaze Approval Needed",
@@ -429,34 +1086,37 @@ def build_approval_embed(guild: discord.Guild, glaze: Dict[str, Any]) -> discord
     return e
 
 
-class ApprovalView(discord.ui.View):
-    def __init__(self, glaze_id: str):
-        super().__init__(timeout=None)  # persistent-capable
+async def _approval_admin_check(interaction: discord.Interaction, data: Dict[str, Any]) -> bool:
+    admin_roles = admin_role_set(data)
+    if not is_admin(interaction, admin_roles):
+        await interaction.response.send_message("🚫 You don’t have permission to do that.", ephemeral=True)
+        return False
+    return True
+
+
+# Approve/decline are dynamic items: the glaze id rides in the custom_id and
+# one handler per button type (registered in setup_hook) serves every
+# approval message, including ones posted before a restart.
+class ApproveButton(discord.ui.DynamicItem[discord.ui.Button], template=r"glaze_approve:(?P<glaze_id>[\w-]+)"):
+    def __init__(self, glaze_id: str, disabled: bool = False):
+        super().__init__(discord.ui.Button(
+            label="✅ Approve",
+            style=discord.ButtonStyle.success,
+            custom_id=f"glaze_approve:{glaze_id}",
+            disabled=disabled
+        ))
         self.glaze_id = glaze_id
 
-        # ✅ make button custom_ids unique per glaze
-        for child in self.children:
-            if isinstance(child, discord.ui.Button):
-                if child.label == "✅ Approve":
-                    child.custom_id = f"glaze_approve:{glaze_id}"
-                elif child.label == "❌ Decline":
-                    child.custom_id = f"glaze_decline:{glaze_id}"
-
-    async def _admin_check(self, interaction: discord.Interaction) -> bool:
-        data, _ = await load_data()
-        admin_roles = data.get("config", {}).get("admin_role_ids", []) or []
-        if not is_admin(interaction, admin_roles):
-            await interaction.response.send_message("🚫 You don’t have permission to do that.", ephemeral=True)
-            return False
-        return True
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["glaze_id"])
 
-    @discord.ui.button(label="✅ Approve", style=discord.ButtonStyle.success)
-    async def approve_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not await self._admin_check(interaction):
+    async def callback(self, interaction: discord.Interaction):
+        data = await load_data()
+        if not await _approval_admin_check(interaction, data):
             return
 
-        data, sha = await load_data()
-        g = next((x for x in data["glazes"] if x["id"] == self.glaze_id), None)
+        g = find_glaze(data, self.glaze_id)
         if not g:
             await interaction.response.send_message("😔 That glaze no longer exists.", ephemeral=True)
             return
@@ -465,27 +1125,39 @@ class ApprovalView(discord.ui.View):
             await interaction.response.send_message("ℹ️ This glaze was already processed.", ephemeral=True)
             return
 
+        was_visible = is_visible(g)
         g["approved"] = True
         g["approval_status"] = "approved"
         g["approved_at"] = iso_utc(now_utc())
         g["approved_by"] = interaction.user.id
+        note_visibility_change(g, was_visible)
 
-        await save_data(data, sha, message="Approve glaze")
+        mark_dirty("Approve glaze")
 
         # disable buttons + mark message
-        for item in self.children:
-            if isinstance(item, discord.ui.Button):
-                item.disabled = True
+        await interaction.response.edit_message(content="✅ Approved.", view=ApprovalView(self.glaze_id, disabled=True))
+
 
-        await interaction.response.edit_message(content="✅ Approved.", view=self)
+class DeclineButton(discord.ui.DynamicItem[discord.ui.Button], template=r"glaze_decline:(?P<glaze_id>[\w-]+)"):
+    def __init__(self, glaze_id: str, disabled: bool = False):
+        super().__init__(discord.ui.Button(
+            label="❌ Decline",
+            style=discord.ButtonStyle.danger,
+            custom_id=f"glaze_decline:{glaze_id}",
+            disabled=disabled
+        ))
+        self.glaze_id = glaze_id
 
-    @discord.ui.button(label="❌ Decline", style=discord.ButtonStyle.danger)
-    async def decline_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not await self._admin_check(interaction):
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["glaze_id"])
+
+    async def callback(self, interaction: discord.Interaction):
+        data = await load_data()
+        if not await _approval_admin_check(interaction, data):
             return
 
-        data, sha = await load_data()
-        g = next((x for x in data["glazes"] if x["id"] == self.glaze_id), None)
+        g = find_glaze(data, self.glaze_id)
         if not g:
             await interaction.response.send_message("😔 That glaze no longer exists.", ephemeral=True)
             return
@@ -494,33 +1166,33 @@ class ApprovalView(discord.ui.View):
             await interaction.response.send_message("ℹ️ This glaze was already processed.", ephemeral=True)
             return
 
+        was_visible = is_visible(g)
         g["approved"] = False
         g["approval_status"] = "declined"
         g["declined_at"] = iso_utc(now_utc())
         g["declined_by"] = interaction.user.id
         g["deleted"] = True  # ensures it never appears anywhere
+        note_visibility_change(g, was_visible)
 
-        await save_data(data, sha, message="Decline glaze")
+        mark_dirty("Decline glaze")
 
-        # DM the sender
-        try:
-            u = await bot.fetch_user(int(g["sender_id"]))
-            await u.send(
-                "⚠️ Your glaze was **flagged as inappropriate** and wasn’t approved.\n\n"
-                "Please remember to be kind and keep glazes **SFW**. 🍯"
+        # DM the sender while the approval message updates
+        sender_txt = f"<@{g['sender_id']}>"
+        await asyncio.gather(
+            dm_quietly(g["sender_id"], DECLINE_DM),
+            interaction.response.edit_message(
+                content=f"❌ Declined (sender notified). Sender was: {sender_txt}",
+                view=ApprovalView(self.glaze_id, disabled=True)
             )
-        except Exception:
-            pass
+        )
 
-        for item in self.children:
-            if isinstance(item, discord.ui.Button):
-                item.disabled = True
 
-        sender_txt = f"<@{int(g['sender_id'])}>"
-        await interaction.response.edit_message(
-            content=f"❌ Declined (sender notified). Sender was: {sender_txt}",
-            view=self
-        )
+# the Approve/Decline pair for one glaze; only built to send or redraw a message
+class ApprovalView(discord.ui.View):
+    def __init__(self, glaze_id: str, disabled: bool = False):
+        super().__init__(timeout=None)
+        self.add_item(ApproveButton(glaze_id, disabled=disabled))
+        self.add_item(DeclineButton(glaze_id, disabled=disabled))
 
 # =========================================================
 # UI: Say Thanks modal
@@ -541,21 +1213,14 @@ class ThanksModal(discord.ui.Modal, title="Say Thanks! 💐"):
     async def on_submit(self, interaction: discord.Interaction):
         thank_text = (self.message.value or "").strip()
 
-        try:
-            u = await bot.fetch_user(self.sender_id)
-
-            dm = (
-                "💐 Someone wants to thank you for your glaze!\n\n"
-                f"🍯 **Your glaze:**\n“{self.glaze_text}”\n\n"
-            )
-            if thank_text:
-                dm += f"💬 **Their message:**\n“{thank_text}”"
+        dm = THANKS_DM.format(text=self.glaze_text)
+        if thank_text:
+            dm += THANKS_DM_NOTE.format(note=thank_text)
 
-            await u.send(dm)
-        except Exception:
-            pass
-
-        await interaction.response.send_message("💐 Thanks sent!", ephemeral=True)
+        await asyncio.gather(
+            dm_quietly(self.sender_id, dm),
+            interaction.response.send_message("💐 Thanks sent!", ephemeral=True)
+        )
 
 
 # =========================================================
@@ -585,7 +1250,7 @@ class ShareModal(discord.ui.Modal, title="Share this glaze 🍯"):
             ephemeral=True
         )
 
-class ShareConfirmView(discord.ui.View):
+class ShareConfirmView(OwnerOnlyView):
     def __init__(self, owner_id: int, glaze_id: str, note: str):
         super().__init__(timeout=60)
         self.owner_id = owner_id
@@ -594,23 +1259,18 @@ class ShareConfirmView(discord.ui.View):
 
     @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.secondary)
     async def cancel(self, interaction: discord.Interaction, _button: discord.ui.Button):
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message(NOT_YOUR_MENU, ephemeral=True)
-            return
         await interaction.response.edit_message(content="❌ Share cancelled.", view=None)
 
     @discord.ui.button(label="📣 Share", style=discord.ButtonStyle.primary)
     async def share(self, interaction: discord.Interaction, _button: discord.ui.Button):
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message(NOT_YOUR_MENU, ephemeral=True)
-            return
-
+        # ack first: posting to the drop channel is a network round-trip
+        await interaction.response.defer()
         ok, msg = await share_glaze(interaction, self.glaze_id, self.note)
         if not ok:
-            await interaction.response.edit_message(content=msg, view=None)
+            await interaction.edit_original_response(content=msg, view=None)
             return
 
-        await interaction.response.edit_message(content="📣 Glaze shared in the server 🍯", view=None)
+        await interaction.edit_original_response(content="📣 Glaze shared in the server 🍯", view=None)
 
 
 # =========================================================
@@ -623,107 +1283,105 @@ class DeleteScoldView(discord.ui.View):
 
     @discord.ui.button(label="💥 Delete Glaze and Scold Glazer", style=discord.ButtonStyle.danger)
     async def delete_scold(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data, sha = await load_data()
-        admin_roles = data["config"].get("admin_role_ids", [])
+        data = await load_data()
+        admin_roles = admin_role_set(data)
         if not is_admin(interaction, admin_roles):
             await interaction.response.send_message("🚫 You don’t have permission to do that.", ephemeral=True)
             return
 
-        glaze = next((g for g in data["glazes"] if g["id"] == self.glaze_id), None)
+        glaze = find_glaze(data, self.glaze_id)
         if not glaze or glaze.get("deleted"):
             await interaction.response.send_message("😔 That glaze is already deleted or missing.", ephemeral=True)
             return
 
+        was_visible = is_visible(glaze)
         glaze["deleted"] = True
-        await save_data(data, sha, message="Delete glaze (mod action)")
+        note_visibility_change(glaze, was_visible)
+        mark_dirty("Delete glaze (mod action)")
 
         # scold DM includes the reported glaze text
-        try:
-            u = await bot.fetch_user(int(glaze["sender_id"]))
-            await u.send(
-                "⚠️ **Your glaze was reported and removed**\n\n"
-                "🍯 **Reported glaze:**\n"
-                f"“{glaze['text']}”\n\n"
-                "Please remember to keep glazes kind and SFW."
-            )
-        except Exception:
-            pass
-
         button.disabled = True
-        await interaction.response.edit_message(content="✅ Deleted and scolded.", view=self)
+        await asyncio.gather(
+            dm_quietly(glaze["sender_id"], SCOLD_DM.format(text=glaze["text"])),
+            interaction.response.edit_message(content="✅ Deleted and scolded.", view=self)
+        )
 
 
 # =========================================================
 # UI: My glazes paginated view
 # =========================================================
-class MyGlazesView(discord.ui.View):
-    def __init__(self, owner_id: int, glaze_ids: List[str]):
+class MyGlazesView(OwnerOnlyView):
+    def __init__(self, owner_id: int, glazes: List[Dict[str, Any]]):
         super().__init__(timeout=300)
         self.owner_id = owner_id
-        self.glaze_ids = glaze_ids
+        # live references into the cached store, resolved once by open_my_glazes
+        self.glazes = glazes
         self.index = 0
+        # page embeds, built the first time each page is shown
+        self._pages: Dict[int, discord.Embed] = {}
 
         self.prev_btn.disabled = True
-        self.next_btn.disabled = len(glaze_ids) <= 1
+        self.next_btn.disabled = len(glazes) <= 1
 
-    async def _get_current_glaze(self) -> Optional[Dict[str, Any]]:
-        data, _ = await load_data()
-        g = next((x for x in data["glazes"] if x["id"] == self.glaze_ids[self.index]), None)
-        if not g or g.get("deleted") or not g.get("approved"):
+    def _get_current_glaze(self) -> Optional[Dict[str, Any]]:
+        g = self.glazes[self.index]
+        if g.get("deleted") or not g.get("approved"):
             return None
         return g
 
+    def page_embed(self) -> discord.Embed:
+        embed = self._pages.get(self.index)
+        if embed is None:
+            g = self.glazes[self.index]
+            received_str = fmt_london_date(g["created_at_ts"])
+            embed = build_my_glaze_embed(self.index, len(self.glazes), g["text"], received_str)
+            self._pages[self.index] = embed
+        return embed
+
     async def _render(self, interaction: discord.Interaction):
-        g = await self._get_current_glaze()
+        g = self._get_current_glaze()
         if not g:
             await interaction.response.edit_message(content="😔 That glaze is no longer available.", embed=None, view=None)
             return
 
-        created = parse_iso(g["created_at"]).astimezone(LONDON)
-        received_str = created.strftime("%d %b %Y")
+        embed = self.page_embed()
 
-        embed = build_my_glaze_embed(self.index, len(self.glaze_ids), g["text"], received_str)
+        prev_disabled = (self.index == 0)
+        next_disabled = (self.index >= len(self.glazes) - 1)
 
-        self.prev_btn.disabled = (self.index == 0)
-        self.next_btn.disabled = (self.index >= len(self.glaze_ids) - 1)
+        # only re-send the components when a button actually flipped;
+        # omitting view= leaves the message's existing buttons untouched
+        if prev_disabled == self.prev_btn.disabled and next_disabled == self.next_btn.disabled:
+            await interaction.response.edit_message(embed=embed)
+            return
 
+        self.prev_btn.disabled = prev_disabled
+        self.next_btn.disabled = next_disabled
         await interaction.response.edit_message(embed=embed, view=self)
 
     @discord.ui.button(label="⬅️", style=discord.ButtonStyle.secondary)
     async def prev_btn(self, interaction: discord.Interaction, _button: discord.ui.Button):
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message(NOT_YOUR_MENU, ephemeral=True)
-            return
         self.index = max(0, self.index - 1)
         await self._render(interaction)
 
     @discord.ui.button(label="➡️", style=discord.ButtonStyle.secondary)
     async def next_btn(self, interaction: discord.Interaction, _button: discord.ui.Button):
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message(NOT_YOUR_MENU, ephemeral=True)
-            return
-        self.index = min(len(self.glaze_ids) - 1, self.index + 1)
+        self.index = min(len(self.glazes) - 1, self.index + 1)
         await self._render(interaction)
 
     @discord.ui.button(label="Say Thanks! 💐", style=discord.ButtonStyle.secondary)
     async def thanks_btn(self, interaction: discord.Interaction, _button: discord.ui.Button):
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message(NOT_YOUR_MENU, ephemeral=True)
-            return
-        g = await self._get_current_glaze()
+        g = self._get_current_glaze()
         if not g:
             await interaction.response.send_message("😔 That glaze is no longer available.", ephemeral=True)
             return
         await interaction.response.send_modal(
-            ThanksModal(sender_id=int(g["sender_id"]), glaze_text=g["text"])
+            ThanksModal(sender_id=g["sender_id"], glaze_text=g["text"])
         )
 
     @discord.ui.button(label="Report ⚠️", style=discord.ButtonStyle.secondary)
     async def report_btn(self, interaction: discord.Interaction, _button: discord.ui.Button):
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message(NOT_YOUR_MENU, ephemeral=True)
-            return
-        g = await self._get_current_glaze()
+        g = self._get_current_glaze()
         if not g:
             await interaction.response.send_message("😔 That glaze is no longer available.", ephemeral=True)
             return
@@ -731,10 +1389,7 @@ class MyGlazesView(discord.ui.View):
 
     @discord.ui.button(label="📣 Share", style=discord.ButtonStyle.secondary)
     async def share_btn(self, interaction: discord.Interaction, _button: discord.ui.Button):
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message(NOT_YOUR_MENU, ephemeral=True)
-            return
-        g = await self._get_current_glaze()
+        g = self._get_current_glaze()
         if not g:
             await interaction.response.send_message("⚠️ This glaze can’t be shared.", ephemeral=True)
             return
@@ -745,55 +1400,59 @@ class MyGlazesView(discord.ui.View):
 # Core actions (open glazes, DM mail, share, report)
 # =========================================================
 async def open_my_glazes(interaction: discord.Interaction):
-    data, _ = await load_data()
-    glz = [g for g in data["glazes"] if int(g["recipient_id"]) == interaction.user.id and g.get("approved") and not g.get("deleted")]
+    data = await load_data()
+    glz = glazes_for_recipient(data, interaction.user.id)
     if not glz:
         await interaction.response.send_message("😔 You don’t have any glazes yet…", ephemeral=True)
         return
 
-    glz.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    ids = [g["id"] for g in glz]
-
-    first = glz[0]
-    created = parse_iso(first["created_at"]).astimezone(LONDON).strftime("%d %b %Y")
-    embed = build_my_glaze_embed(0, len(ids), first["text"], created)
-
-    view = MyGlazesView(owner_id=interaction.user.id, glaze_ids=ids)
+    view = MyGlazesView(owner_id=interaction.user.id, glazes=glz)
+    embed = view.page_embed()
     await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
 
 async def send_glaze_mail(interaction: discord.Interaction):
-    data, _ = await load_data()
-    glz = [g for g in data["glazes"] if int(g["recipient_id"]) == interaction.user.id and g.get("approved") and not g.get("deleted")]
+    data = await load_data()
+    glz = glazes_for_recipient(data, interaction.user.id)
     if not glz:
         await interaction.response.send_message("😔 You don’t have any glazes yet…", ephemeral=True)
         return
 
-    glz.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    lines = ["💌 **Your Glaze Mail**\n"]
-    for g in glz[:50]:
-        dt = parse_iso(g["created_at"]).astimezone(LONDON).strftime("%d %b %Y")
-        lines.append(f"• {dt} — “{g['text']}”")
+    # 50 glazes of up to 500 chars won't fit one DM, so it goes out in parts
+    chunks = chunk_lines(itertools.chain(
+        ("💌 **Your Glaze Mail**\n",),
+        (f"• {fmt_london_date(g['created_at_ts'])} — “{g['text']}”" for g in itertools.islice(glz, 50))
+    ))
 
+    # opening the DM channel + sending is REST work, so ack first
+    await interaction.response.defer(ephemeral=True, thinking=True)
     try:
-        await interaction.user.send("\n".join(lines))
-        await interaction.response.send_message("💌 Glaze Mail complete — check your DMs!", ephemeral=True)
+        await interaction.user.send(chunks[0])
     except Exception:
-        await interaction.response.send_message("⚠️ I couldn’t DM you — please enable DMs to receive Glaze Mail.", ephemeral=True)
+        await interaction.followup.send("⚠️ I couldn’t DM you — please enable DMs to receive Glaze Mail.", ephemeral=True)
+        return
+
+    await interaction.followup.send("💌 Glaze Mail complete — check your DMs!", ephemeral=True)
+    # the rest in order (one DM channel, so no point sending them concurrently)
+    for chunk in chunks[1:]:
+        try:
+            await interaction.user.send(chunk)
+        except Exception:
+            break
 
 async def share_glaze(interaction: discord.Interaction, glaze_id: str, note: str) -> Tuple[bool, str]:
     guild = await get_single_guild()
     if not guild:
         return False, "⚠️ Server not ready."
 
-    data, _ = await load_data()
-    glaze = next((g for g in data["glazes"] if g["id"] == glaze_id), None)
+    data = await load_data()
+    glaze = find_glaze(data, glaze_id)
     if not glaze or glaze.get("deleted"):
         return False, "⚠️ This glaze can’t be shared."
 
-    if interaction.user.id != int(glaze["recipient_id"]):
+    if interaction.user.id != glaze["recipient_id"]:
         return False, NOT_YOUR_MENU
 
-    ch = await get_drop_channel(guild)
+    ch = await get_drop_channel(guild, data)
     if not ch:
         return False, "⚠️ Drop channel isn’t set. Ask an admin to run /controlpanel."
 
@@ -807,22 +1466,22 @@ async def report_glaze(interaction: discord.Interaction, glaze_id: str):
         await interaction.response.send_message("⚠️ Server not ready.", ephemeral=True)
         return
 
-    report_ch = await get_report_channel(guild)
+    data = await load_data()
+    report_ch = await get_report_channel(guild, data)
     if not report_ch:
         await interaction.response.send_message("⚠️ Report channel isn’t set. Ask an admin to run /controlpanel.", ephemeral=True)
         return
 
-    data, sha = await load_data()
-    glaze = next((g for g in data["glazes"] if g["id"] == glaze_id), None)
+    glaze = find_glaze(data, glaze_id)
     if not glaze or glaze.get("deleted"):
         await interaction.response.send_message("😔 That glaze is no longer available.", ephemeral=True)
         return
 
     glaze["reported"] = True
-    await save_data(data, sha, message="Report glaze")
+    mark_dirty("Report glaze")
 
     reporter = interaction.user.mention
-    recipient_mention = f"<@{int(glaze['recipient_id'])}>"
+    recipient_mention = f"<@{glaze['recipient_id']}>"
 
     content = (
         "⚠️ **GLAZE REPORTED**\n\n"
@@ -832,8 +1491,9 @@ async def report_glaze(interaction: discord.Interaction, glaze_id: str):
         f"Content:\n“{glaze['text']}”"
     )
 
+    await interaction.response.defer(ephemeral=True, thinking=True)
     await report_ch.send(content, view=DeleteScoldView(glaze_id=glaze_id))
-    await interaction.response.send_message("⚠️ Report sent to the mods. Thank you.", ephemeral=True)
+    await interaction.followup.send("⚠️ Report sent to the mods. Thank you.", ephemeral=True)
 
 
 # =========================================================
@@ -865,12 +1525,31 @@ async def controlpanel(
     approval_channel: discord.TextChannel | None = None,
     approvals_enabled: bool | None = None,
 ):
+    await interaction.response.defer()
+
     # MUST be non-ephemeral (interfering admins)
     if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("🚫 Admins only.")
+        await interaction.followup.send("🚫 Admins only.")
         return
 
-    data, sha = await load_data()
+    # validate before touching config, so a bad value leaves nothing half-applied
+    new_limit: Union[int, str, None] = None
+    if daily_drop_limit is not None:
+        val = daily_drop_limit.strip().lower()
+        if val == "all":
+            new_limit = "all"
+        else:
+            try:
+                new_limit = int(val)
+                if new_limit < 1:
+                    raise ValueError()
+            except Exception:
+                await interaction.followup.send(
+                    '🍯 Invalid daily_drop_limit. Use a number like "3" or the literal string "all".'
+                )
+                return
+
+    data = await load_data()
     changes: List[str] = []
     
     if approvals_enabled is not None:
@@ -899,32 +1578,20 @@ async def controlpanel(
         changes.append(f"• Report channel → {report_channel.mention}")
 
     if admin_role is not None:
-        role_ids = set(data["config"].get("admin_role_ids", []))
+        role_ids = data["config"].setdefault("admin_role_ids", [])
         if admin_role.id in role_ids:
             role_ids.remove(admin_role.id)
             changes.append(f"• Admin role removed → {admin_role.mention}")
         else:
-            role_ids.add(admin_role.id)
+            role_ids.append(admin_role.id)
             changes.append(f"• Admin role added → {admin_role.mention}")
-        data["config"]["admin_role_ids"] = list(role_ids)
 
-    if daily_drop_limit is not None:
-        val = daily_drop_limit.strip().lower()
-        if val == "all":
-            data["config"]["daily_drop_limit"] = "all"
+    if new_limit is not None:
+        data["config"]["daily_drop_limit"] = new_limit
+        if new_limit == "all":
             changes.append('• Daily drop limit → "all" (drops all undropped glazes)')
         else:
-            try:
-                n = int(val)
-                if n < 1:
-                    raise ValueError()
-                data["config"]["daily_drop_limit"] = n
-                changes.append(f"• Daily drop limit → {n}")
-            except Exception:
-                await interaction.response.send_message(
-                    '🍯 Invalid daily_drop_limit. Use a number like "3" or the literal string "all".'
-                )
-                return
+            changes.append(f"• Daily drop limit → {new_limit}")
 
     if daily_drop_hour is not None:
         h = max(0, min(23, int(daily_drop_hour)))
@@ -937,17 +1604,19 @@ async def controlpanel(
         changes.append(f"• Daily drop minute → {m:02d} (London)")
 
     if not changes:
-        await interaction.response.send_message("🍯 Nothing changed — provide at least one option to update.")
+        await interaction.followup.send("🍯 Nothing changed — provide at least one option to update.")
         return
 
-    await save_data(data, sha, message="Update Glaze controlpanel")
+    mark_dirty("Update Glaze controlpanel")
+    invalidate_config_cache()
+    _scheduler_wake.set()  # drop time may have moved
 
     hour, minute, limit = _get_daily_drop_settings(data)
     current_roles = ", ".join(f"<@&{r}>" for r in data["config"]["admin_role_ids"]) or "None"
     limit_str = "all" if limit == "all" else str(limit)
     enabled = bool(data["config"].get("enabled", True))
 
-    await interaction.response.send_message(
+    await interaction.followup.send(
         "🍯 **Glaze configuration updated**\n"
         + "\n".join(changes)
         + f"\n\n**Current settings:**"
@@ -970,11 +1639,9 @@ async def glaze_cmd(interaction: discord.Interaction, member: discord.Member, me
         await interaction.response.send_message("⚠️ Server not ready.", ephemeral=True)
         return
 
-    # ✅ ack instantly so GitHub work doesn't time out the interaction
-    await interaction.response.defer(ephemeral=True)
-
+    # input-only checks answer straight away, before any defer or store work
     if member.id == interaction.user.id:
-        await interaction.followup.send(
+        await interaction.response.send_message(
             SELF_GLAZE_ROAST.format(user=interaction.user.mention),
             ephemeral=False
         )
@@ -982,27 +1649,25 @@ async def glaze_cmd(interaction: discord.Interaction, member: discord.Member, me
 
     text = message.strip()
     if len(text) < 10:
-        await interaction.followup.send("🍯 Make it a bit longer — at least 10 characters.", ephemeral=True)
+        await interaction.response.send_message("🍯 Make it a bit longer — at least 10 characters.", ephemeral=True)
         return
     if len(text) > 500:
-        await interaction.followup.send("🍯 Keep it under 500 characters please.", ephemeral=True)
+        await interaction.response.send_message("🍯 Keep it under 500 characters please.", ephemeral=True)
         return
 
-    global _cached_data, _cached_sha
-    _cached_data = None
-    _cached_sha = None
+    # ✅ ack instantly so GitHub work doesn't time out the interaction
+    await interaction.response.defer(ephemeral=True)
 
-    data, sha = await load_data()
+    data = await load_data()
 
     if not bool(data.get("config", {}).get("enabled", True)):
         await interaction.followup.send(GLAZE_DISABLED_MSG, ephemeral=True)
         return
 
     cd = _get_cooldown_td(data)
-    last = data["cooldowns"].get(str(interaction.user.id))
+    last = data["cooldowns"].get(interaction.user.id)
     if last:
-        diff = now_utc() - parse_iso(last)
-        if diff < cd:
+        if now_utc().timestamp() - iso_ts(last) < cd.total_seconds():
             await interaction.followup.send("⏳ You’re on cooldown — try again later.", ephemeral=True)
             return
 
@@ -1014,6 +1679,7 @@ async def glaze_cmd(interaction: discord.Interaction, member: discord.Member, me
         "recipient_id": member.id,
         "text": text,
         "created_at": iso_utc(created),
+        "created_at_ts": int(created.timestamp()),
         "month_key": month_key(created),
         "dropped_at": None,
         "deleted": False,
@@ -1024,7 +1690,7 @@ async def glaze_cmd(interaction: discord.Interaction, member: discord.Member, me
     }
 
     data["glazes"].append(glaze)
-    data["cooldowns"][str(interaction.user.id)] = iso_utc(created)
+    data["cooldowns"][interaction.user.id] = iso_utc(created)
 
     approvals_on = bool(data.get("config", {}).get("approvals_enabled", False))
 
@@ -1032,157 +1698,229 @@ async def glaze_cmd(interaction: discord.Interaction, member: discord.Member, me
         glaze["approved"] = False
         glaze["approval_status"] = "pending"
 
-        await save_data(data, sha, message="Add glaze (pending approval)")
-
-        approval_ch = await get_approval_channel(guild)
-        if approval_ch:
-            msg = await approval_ch.send(
-                embed=build_approval_embed(guild, glaze),
-                view=ApprovalView(glaze_id=g_id)
-            )
-
-            _cached_data = None
-            _cached_sha = None
-            data2, sha2 = await load_data()
-            g2 = next((x for x in data2["glazes"] if x["id"] == g_id), None)
-            if g2:
-                g2["approval_message"] = {
+        # one mark covers both the new glaze and its approval message ids;
+        # finally keeps the glaze even if the approval post fails
+        try:
+            approval_ch = await get_approval_channel(guild, data)
+            if approval_ch:
+                msg = await approval_ch.send(
+                    embed=build_approval_embed(guild, glaze),
+                    view=ApprovalView(glaze_id=g_id)
+                )
+                glaze["approval_message"] = {
                     "channel_id": approval_ch.id,
                     "message_id": msg.id
                 }
-                await save_data(data2, sha2, message="Store approval message ids")
+        finally:
+            mark_dirty("Add glaze (pending approval)")
     else:
-        await save_data(data, sha, message="Add glaze")
+        mark_dirty("Add glaze")
 
     await interaction.followup.send("✅ Your glaze has been submitted! 🍯", ephemeral=True)
 
 @bot.tree.command(name="myglaze", description="See your glazes (buttons + DM option).")
 async def myglaze_cmd(interaction: discord.Interaction):
-    data, _ = await load_data()
-    glz = [g for g in data["glazes"] if int(g["recipient_id"]) == interaction.user.id and g.get("approved") and not g.get("deleted")]
-    if not glz:
-        await interaction.response.send_message("😔 You don’t have any glazes yet… but your time will come 🍯", ephemeral=True)
+    await interaction.response.defer(ephemeral=True)
+    data = await load_data()
+    if not has_glazes(data, interaction.user.id):
+        await interaction.followup.send("😔 You don’t have any glazes yet… but your time will come 🍯", ephemeral=True)
         return
-    await interaction.response.send_message("🍯 Your glaze menu:", view=MyGlazeHubView(owner_id=interaction.user.id), ephemeral=True)
+    await interaction.followup.send("🍯 Your glaze menu:", view=MyGlazeHubView(owner_id=interaction.user.id), ephemeral=True)
 
 
+# title/footer never change; each call copies this and adds its fields
+_LEADERBOARD_EMBED = discord.Embed(title="🍯 Glaze Leaderboard")
+_LEADERBOARD_EMBED.set_footer(text=FOOTER_TEXT)
+
 @bot.tree.command(name="glazeleaderboard", description="Monthly winners + top glazers")
 async def glazeleaderboard_cmd(interaction: discord.Interaction):
-    data, _ = await load_data()
+    await interaction.response.defer()
+    data = await load_data()
 
     wins = data.get("wins", {})
     if wins:
-        sorted_wins = sorted(((int(uid), cnt) for uid, cnt in wins.items()), key=lambda x: x[1], reverse=True)[:5]
-        monthly_lines = [f"**{i}.** <@{uid}> — **{cnt}** win(s)" for i, (uid, cnt) in enumerate(sorted_wins, start=1)]
+        top_wins = heapq.nlargest(5, wins.items(), key=lambda x: x[1])
+        monthly_text = "\n".join(f"**{i}.** <@{uid}> — **{cnt}** win(s)" for i, (uid, cnt) in enumerate(top_wins, start=1))
     else:
-        monthly_lines = ["No monthly winners yet 🍯"]
-
-    sender_counts: Dict[int, int] = {}
-    for g in data.get("glazes", []):
-        if not g.get("deleted") and g.get("approved"):
-            sid = int(g["sender_id"])
-            sender_counts[sid] = sender_counts.get(sid, 0) + 1
+        monthly_text = "No monthly winners yet 🍯"
 
-    if sender_counts:
-        sorted_senders = sorted(sender_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        sender_lines = [f"**{i}.** <@{uid}>" for i, (uid, cnt) in enumerate(sorted_senders, start=1)]
+    sent = sender_counts(data)
+    if sent:
+        top_senders = heapq.nlargest(5, sent.items(), key=lambda x: x[1])
+        sender_text = "\n".join(f"**{i}.** <@{uid}>" for i, (uid, _) in enumerate(top_senders, start=1))
     else:
-        sender_lines = ["No glazes sent yet 🍯"]
+        sender_text = "No glazes sent yet 🍯"
 
-    embed = discord.Embed(title="🍯 Glaze Leaderboard")
-    embed.add_field(name="🏆 Most Glazed (Monthly Wins)", value="\n".join(monthly_lines), inline=False)
-    embed.add_field(name="🍯 Top Glazers (Most Sent)", value="\n".join(sender_lines), inline=False)
-    embed.set_footer(text=FOOTER_TEXT)
+    embed = _LEADERBOARD_EMBED.copy()
+    embed.add_field(name="🏆 Most Glazed (Monthly Wins)", value=monthly_text, inline=False)
+    embed.add_field(name="🍯 Top Glazers (Most Sent)", value=sender_text, inline=False)
 
-    await interaction.response.send_message(embed=embed)
+    await interaction.followup.send(embed=embed)
 
 
 @bot.tree.command(name="randomdrop", description="Drop one random pending glaze right now (Glaze admins only).")
 async def randomdrop_cmd(interaction: discord.Interaction):
-    data, sha = await load_data()
+    await interaction.response.defer(ephemeral=True)
+    data = await load_data()
     
     if not bool(data.get("config", {}).get("enabled", True)):
-        await interaction.response.send_message("🍯 Glaze is switched off right now.", ephemeral=True)
+        await interaction.followup.send("🍯 Glaze is switched off right now.", ephemeral=True)
         return
     
-    admin_roles = data["config"].get("admin_role_ids", [])
+    admin_roles = admin_role_set(data)
 
     if not is_admin(interaction, admin_roles):
-        await interaction.response.send_message("🚫 You don’t have permission to do that.", ephemeral=True)
+        await interaction.followup.send("🚫 You don’t have permission to do that.", ephemeral=True)
         return
 
     guild = await get_single_guild()
     if not guild:
-        await interaction.response.send_message("⚠️ Server not ready.", ephemeral=True)
+        await interaction.followup.send("⚠️ Server not ready.", ephemeral=True)
         return
 
-    drop_ch = await get_drop_channel(guild)
+    drop_ch = await get_drop_channel(guild, data)
     if not drop_ch:
-        await interaction.response.send_message("⚠️ Drop channel isn’t set. Ask an admin to run /controlpanel.", ephemeral=True)
+        await interaction.followup.send("⚠️ Drop channel isn’t set. Ask an admin to run /controlpanel.", ephemeral=True)
         return
 
-    pending = [g for g in data["glazes"] if g.get("approved") and not g.get("deleted") and not g.get("dropped_at")]
+    pending = pending_glazes(data)
     if not pending:
-        await interaction.response.send_message("🍯 No pending glazes to drop.", ephemeral=True)
+        await interaction.followup.send("🍯 No pending glazes to drop.", ephemeral=True)
         return
 
     g = random.choice(pending)
-    recipient = guild.get_member(int(g["recipient_id"]))
 
     # post publicly
-    if recipient:
-        await drop_ch.send(f"{DAILY_PING_PREFIX}\n{recipient.mention}")
-        await drop_ch.send(embed=build_daily_embed(recipient.display_name, g["text"]))
-    else:
-        await drop_ch.send(f"{DAILY_PING_PREFIX}\n<@{int(g['recipient_id'])}>")
-        await drop_ch.send(embed=build_daily_embed("Someone", g["text"]))
+    await _drop_one_glaze(drop_ch, guild, g)
 
     # mark as dropped (REAL drop) — but DO NOT touch last_daily_drop_date
     g["dropped_at"] = iso_utc(now_utc())
-    await save_data(data, sha, message="Random glaze drop (admin)")
+    mark_dirty("Random glaze drop (admin)")
+
+    await interaction.followup.send("🍯 Random glaze dropped.", ephemeral=True)
+
+
+@bot.tree.command(name="glazerefresh", description="Reload glaze data from GitHub after a manual edit (Glaze admins only).")
+@app_commands.describe(discard_unsaved="Throw away changes the bot hasn't saved yet and reload anyway")
+async def glazerefresh_cmd(interaction: discord.Interaction, discard_unsaved: bool | None = False):
+    await interaction.response.defer(ephemeral=True)
+    data = await load_data()
 
-    await interaction.response.send_message("🍯 Random glaze dropped.", ephemeral=True)
+    admin_roles = admin_role_set(data)
+    if not is_admin(interaction, admin_roles):
+        await interaction.followup.send("🚫 You don’t have permission to do that.", ephemeral=True)
+        return
+
+    if discard_unsaved:
+        await discard_pending()
+    elif _dirty.is_set():
+        # a refresh never overwrites unsaved changes unless asked to
+        await interaction.followup.send(
+            "⏳ Recent changes are still being saved — try again in a few seconds.\n"
+            "If saving keeps failing, run `/glazerefresh discard_unsaved:True` to drop them and reload.",
+            ephemeral=True
+        )
+        return
+
+    await load_data(refresh=True)
+    if _dirty.is_set():
+        await interaction.followup.send("⏳ Something changed while reloading — try again in a few seconds.", ephemeral=True)
+        return
+    await interaction.followup.send("🔄 Glaze data reloaded from GitHub.", ephemeral=True)
 
 
 # =========================================================
 # Monthly winner calculation
 # =========================================================
 def compute_month_winner(data: Dict[str, Any], month_key_str: str) -> Optional[Tuple[int, int]]:
-    month_glazes = [g for g in data["glazes"] if g.get("month_key") == month_key_str and g.get("approved") and not g.get("deleted")]
-    if not month_glazes:
+    counts = month_recipient_counts(data, month_key_str)
+    if not counts:
         return None
 
-    month_glazes.sort(key=lambda x: x.get("created_at", ""))
-
-    counts: Dict[int, int] = {}
-    for g in month_glazes:
-        rid = int(g["recipient_id"])
-        counts[rid] = counts.get(rid, 0) + 1
-
     best = max(counts.values())
     tied = [rid for rid, c in counts.items() if c == best]
     if len(tied) == 1:
         return tied[0], best
 
-    nth_time: Dict[int, str] = {}
-    running: Dict[int, int] = {rid: 0 for rid in tied}
-    for g in month_glazes:
-        rid = int(g["recipient_id"])
-        if rid not in running:
+    # tie-break: whoever reached the winning count first. The month index
+    # keeps append order, which is creation order, so the first tied
+    # recipient to hit `best` on a forward walk is the winner.
+    running: Dict[int, int] = dict.fromkeys(tied, 0)
+    for g in glazes_in_month(data, month_key_str):
+        rid = g["recipient_id"]
+        if rid not in running or not is_visible(g):
             continue
         running[rid] += 1
-        if running[rid] == best and rid not in nth_time:
-            nth_time[rid] = g["created_at"]
+        if running[rid] == best:
+            return rid, best
 
-    tied.sort(key=lambda rid: nth_time.get(rid, "9999-99-99"))
     return tied[0], best
 
 
 ##### help command ######
+# static help text; only the description and rules depend on config
+_HELP_COMMANDS_FIELD = (
+    "`/glaze <member> <message>`\n"
+    "Send an anonymous glaze\n\n"
+    "`/myglaze`\n"
+    "View glazes you’ve received (buttons + DM option)\n\n"
+    "`/glazeleaderboard`\n"
+    "See monthly winners & top glazers"
+)
+
+_HELP_DROPS_FIELD = (
+    "• Daily Drop posts glazes publicly with a ping + embed\n"
+    "• Monthly Drop announces the most glazed member 🎉\n\n"
+    "**Daily drop limit rules:**\n"
+    "• `1` → drops 1 glaze\n"
+    "• `N` → drops N glazes\n"
+    "• `\"all\"` → drops **all undropped glazes**"
+)
+
+_HELP_ADMIN_EMBED = discord.Embed(
+    title="🔒 Glaze Admin Help",
+    description="Admin-only tools & moderation controls.",
+    color=GLAZE_YELLOW
+)
+_HELP_ADMIN_EMBED.add_field(
+    name="🛠️ Admin Commands",
+    value=(
+        "`/controlpanel`\n"
+        "Set drop channel, report channel, Glaze admins, daily drop limit & daily drop time\n\n"
+        "`/randomdrop`\n"
+        "Drops **one random pending glaze** right now (real drop)\n"
+        "✅ Marks it as dropped\n"
+        "❌ Does not affect the 5pm daily-drop tracker\n\n"
+        "`/glazerefresh`\n"
+        "Reloads glaze data after a manual edit of the JSON on GitHub\n"
+        "(`discard_unsaved:True` drops changes that couldn’t be saved)"
+    ),
+    inline=False
+)
+_HELP_ADMIN_EMBED.add_field(
+    name="⚠️ Moderation",
+    value=(
+        "• Reported glazes appear in the report channel\n"
+        "• Mods can delete glazes & DM the sender\n"
+        "• Deleted glazes never appear again"
+    ),
+    inline=False
+)
+_HELP_ADMIN_EMBED.set_footer(text=FOOTER_TEXT)
+
 @bot.tree.command(name="help", description="How Glaze works 🍯")
 @app_commands.describe(admin="Show admin-only help (Glaze admins only)")
 async def help_cmd(interaction: discord.Interaction, admin: bool | None = False):
-    data, _ = await load_data()
+    # store is preloaded in setup_hook, so this is a memory read and the
+    # refusal can go out before the (public) defer
+    data = await load_data()
+
+    if admin and not is_admin(interaction, admin_role_set(data)):
+        await interaction.response.send_message("🍯 That section is for Glaze admins only.", ephemeral=True)
+        return
+
+    await interaction.response.defer()
+
     hour, minute, limit = _get_daily_drop_settings(data)
     cd_hours = int(_get_cooldown_td(data).total_seconds() // 3600)
     limit_str = "all" if limit == "all" else str(limit)
@@ -1196,20 +1934,7 @@ async def help_cmd(interaction: discord.Interaction, admin: bool | None = False)
         ),
         color=GLAZE_YELLOW
     )
-
-    embed.add_field(
-        name="✨ Commands",
-        value=(
-            "`/glaze <member> <message>`\n"
-            "Send an anonymous glaze\n\n"
-            "`/myglaze`\n"
-            "View glazes you’ve received (buttons + DM option)\n\n"
-            "`/glazeleaderboard`\n"
-            "See monthly winners & top glazers"
-        ),
-        inline=False
-    )
-
+    embed.add_field(name="✨ Commands", value=_HELP_COMMANDS_FIELD, inline=False)
     embed.add_field(
         name="🕒 Rules",
         value=(
@@ -1220,62 +1945,14 @@ async def help_cmd(interaction: discord.Interaction, admin: bool | None = False)
         ),
         inline=False
     )
-
-    embed.add_field(
-        name="🍯 Drops",
-        value=(
-            "• Daily Drop posts glazes publicly with a ping + embed\n"
-            "• Monthly Drop announces the most glazed member 🎉\n\n"
-            "**Daily drop limit rules:**\n"
-            "• `1` → drops 1 glaze\n"
-            "• `N` → drops N glazes\n"
-            "• `\"all\"` → drops **all undropped glazes**"
-        ),
-        inline=False
-    )
-
+    embed.add_field(name="🍯 Drops", value=_HELP_DROPS_FIELD, inline=False)
     embed.set_footer(text=FOOTER_TEXT)
 
     if admin:
-        admin_roles = data["config"].get("admin_role_ids", [])
-        if not is_admin(interaction, admin_roles):
-            await interaction.response.send_message("🍯 That section is for Glaze admins only.", ephemeral=True)
-            return
-
-        admin_embed = discord.Embed(
-            title="🔒 Glaze Admin Help",
-            description="Admin-only tools & moderation controls.",
-            color=GLAZE_YELLOW
-        )
-
-        admin_embed.add_field(
-            name="🛠️ Admin Commands",
-            value=(
-                "`/controlpanel`\n"
-                "Set drop channel, report channel, Glaze admins, daily drop limit & daily drop time\n\n"
-                "`/randomdrop`\n"
-                "Drops **one random pending glaze** right now (real drop)\n"
-                "✅ Marks it as dropped\n"
-                "❌ Does not affect the 5pm daily-drop tracker"
-            ),
-            inline=False
-        )
-
-        admin_embed.add_field(
-            name="⚠️ Moderation",
-            value=(
-                "• Reported glazes appear in the report channel\n"
-                "• Mods can delete glazes & DM the sender\n"
-                "• Deleted glazes never appear again"
-            ),
-            inline=False
-        )
-
-        admin_embed.set_footer(text=FOOTER_TEXT)
-        await interaction.response.send_message(embeds=[embed, admin_embed])
+        await interaction.followup.send(embeds=[embed, _HELP_ADMIN_EMBED])
         return
 
-    await interaction.response.send_message(embed=embed)
+    await interaction.followup.send(embed=embed)
 
 ###forcewinner####
 @bot.tree.command(
@@ -1291,33 +1968,28 @@ async def force_winner_cmd(
     month: str | None = None,
     override: bool | None = False
 ):
+    await interaction.response.defer(ephemeral=True)
+
     # ---- admin check (Glaze admins)
-    data, _ = await load_data()
-    admin_roles = data.get("config", {}).get("admin_role_ids", []) or []
+    data = await load_data()
+    admin_roles = admin_role_set(data)
     if not is_admin(interaction, admin_roles):
-        await interaction.response.send_message("🚫 You don’t have permission to do that.", ephemeral=True)
+        await interaction.followup.send("🚫 You don’t have permission to do that.", ephemeral=True)
         return
 
     guild = await get_single_guild()
     if not guild:
-        await interaction.response.send_message("⚠️ Server not ready.", ephemeral=True)
+        await interaction.followup.send("⚠️ Server not ready.", ephemeral=True)
         return
 
-    drop_ch = await get_drop_channel(guild)
+    drop_ch = await get_drop_channel(guild, data)
     if not drop_ch:
-        await interaction.response.send_message(
+        await interaction.followup.send(
             "⚠️ Drop channel isn’t set. Ask an admin to run /controlpanel.",
             ephemeral=True
         )
         return
 
-    # IMPORTANT: always read latest JSON (not stale cache)
-    global _cached_data, _cached_sha
-    _cached_data = None
-    _cached_sha = None
-
-    data, sha = await load_data()
-
     # ---- pick month (default = last month, London time)
     now_ldn = datetime.now(tz=LONDON)
     if month and month.strip():
@@ -1325,7 +1997,7 @@ async def force_winner_cmd(
         try:
             datetime.strptime(mk + "-01", "%Y-%m-%d")
         except Exception:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "🍯 Invalid month. Use **YYYY-MM** (e.g. `2026-01`).",
                 ephemeral=True
             )
@@ -1333,7 +2005,7 @@ async def force_winner_cmd(
     else:
         # last month (London)
         prev_month_dt = (now_ldn.replace(day=1) - timedelta(days=1))
-        mk = prev_month_dt.strftime("%Y-%m")
+        mk = month_key(prev_month_dt)
 
     # ---- already announced?
     last_map = data.get("meta", {}).get("last_monthly_announce", {})
@@ -1342,7 +2014,7 @@ async def force_winner_cmd(
         last_map = data["meta"]["last_monthly_announce"]
 
     if last_map.get(mk) and not override:
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"🍯 Monthly winner for **{mk}** was already announced.\n"
             f"Run again with `override: True` to post it again.",
             ephemeral=True
@@ -1352,7 +2024,7 @@ async def force_winner_cmd(
     # ---- compute winner for that month
     winner = compute_month_winner(data, mk)
     if not winner:
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"🍯 No glazes found for **{mk}** — nothing to tally.",
             ephemeral=True
         )
@@ -1361,17 +2033,16 @@ async def force_winner_cmd(
     winner_id, count = winner
 
     # ---- post publicly
-    await drop_ch.send(f"{MONTHLY_PING_PREFIX}\n@everyone")
-    await drop_ch.send(embed=build_monthly_embed(mk, f"<@{winner_id}>", count))
+    await drop_ch.send(f"{MONTHLY_PING_PREFIX}\n@everyone", embed=build_monthly_embed(mk, f"<@{winner_id}>", count))
 
     # ---- update JSON markers + leaderboard
     data.setdefault("wins", {})
-    data["wins"][str(winner_id)] = int(data["wins"].get(str(winner_id), 0)) + 1
+    data["wins"][winner_id] = data["wins"].get(winner_id, 0) + 1
     data["meta"]["last_monthly_announce"][mk] = iso_utc(now_utc())
 
-    await save_data(data, sha, message=f"Force monthly most glazed {mk}")
+    mark_dirty(f"Force monthly most glazed {mk}")
 
-    await interaction.response.send_message(
+    await interaction.followup.send(
         f"✅ Posted monthly winner for **{mk}**.\nWinner: <@{winner_id}> with **{count}** glazes.",
         ephemeral=True
     )
@@ -1385,74 +2056,123 @@ def is_last_day_of_month_london(dt: datetime) -> bool:
 
 
 async def _drop_one_glaze(drop_ch: discord.TextChannel, guild: discord.Guild, glaze: Dict[str, Any]) -> None:
-    recipient = guild.get_member(int(glaze["recipient_id"]))
+    # ping + embed in one message: one API call per drop
+    # members intent + startup chunking: a cache miss means they've left the server
+    recipient = guild.get_member(glaze["recipient_id"])
     if recipient:
-        await drop_ch.send(f"{DAILY_PING_PREFIX}\n{recipient.mention}")
-        await drop_ch.send(embed=build_daily_embed(recipient.display_name, glaze["text"]))
+        await drop_ch.send(
+            f"{DAILY_PING_PREFIX}\n{recipient.mention}",
+            embed=build_daily_embed(recipient.display_name, glaze["text"])
+        )
     else:
-        await drop_ch.send(f"{DAILY_PING_PREFIX}\n<@{int(glaze['recipient_id'])}>")
-        await drop_ch.send(embed=build_daily_embed("Someone", glaze["text"]))
+        await drop_ch.send(
+            f"{DAILY_PING_PREFIX}\n<@{glaze['recipient_id']}>",
+            embed=build_daily_embed("Someone", glaze["text"])
+        )
 
 
-@tasks.loop(minutes=1)
+# next London time the scheduler has something to do: the daily drop or
+# the monthly drop on the last day of the month
+def _next_drop_time(data: Dict[str, Any], now_ldn: datetime) -> datetime:
+    hour, minute, _ = _get_daily_drop_settings(data)
+    daily = now_ldn.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if daily <= now_ldn:
+        daily += timedelta(days=1)
+
+    month_start = now_ldn.replace(day=1)
+    while True:
+        month_start = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+        monthly = (month_start - timedelta(days=1)).replace(
+            hour=MONTHLY_DROP_HOUR, minute=MONTHLY_DROP_MINUTE, second=0, microsecond=0
+        )
+        if monthly > now_ldn:
+            return min(daily, monthly)
+
+
+# set by /controlpanel so a changed drop time is picked up straight away
+_scheduler_wake = asyncio.Event()
+
 async def glaze_scheduler():
+    # catch up on a drop that came due while the bot was down/redeploying;
+    # the last_daily_drop_date / last_monthly_announce markers make this a
+    # no-op when it already ran. Guilds only exist once the bot is ready.
+    await bot.wait_until_ready()
+    await _scheduler_tick()
+
+    while True:
+        _scheduler_wake.clear()
+        try:
+            data = await load_data()
+            target = _next_drop_time(data, datetime.now(tz=LONDON))
+            # via UTC: same-zone aware datetimes subtract as wall time (wrong across DST)
+            delay = (target.astimezone(timezone.utc) - now_utc()).total_seconds() + 1
+        except Exception as e:
+            print("Scheduler error:", repr(e))
+            target = None
+            delay = 60
+
+        try:
+            await asyncio.wait_for(_scheduler_wake.wait(), timeout=delay)
+            continue  # settings changed; recompute the next wake-up
+        except asyncio.TimeoutError:
+            pass
+
+        if target is not None:
+            late = (now_utc() - target.astimezone(timezone.utc)).total_seconds()
+            if late > 60:
+                print(f"Scheduler woke {late:.0f}s late for {target.isoformat()}; catching up")
+
+        await _scheduler_tick()
+
+
+async def _scheduler_tick():
     try:
         guild = await get_single_guild()
         if not guild:
             return
 
-        data, sha = await load_data()
+        data = await load_data()
         
         if not bool(data.get("config", {}).get("enabled", True)):
             return
         
-        drop_cid = data.get("config", {}).get("drop_channel_id")
-        if not drop_cid:
-            return
-
-        drop_ch = guild.get_channel(int(drop_cid))
-        if not isinstance(drop_ch, discord.TextChannel):
+        drop_ch = await get_drop_channel(guild, data)
+        if not drop_ch:
             return
 
         now_ldn = datetime.now(tz=LONDON)
         today_str = now_ldn.strftime("%Y-%m-%d")
 
-        # daily drop (uses controlpanel settings)
+        # daily drop (uses controlpanel settings); "at or after" rather than
+        # "during" the drop minute, so a late wake-up still drops today
         hour, minute, limit = _get_daily_drop_settings(data)
 
-        if now_ldn.hour == hour and now_ldn.minute == minute:
+        if (now_ldn.hour, now_ldn.minute) >= (hour, minute):
             if data["meta"].get("last_daily_drop_date") != today_str:
-                pending = [g for g in data["glazes"] if g.get("approved") and not g.get("deleted") and not g.get("dropped_at")]
-                pending.sort(key=lambda x: x.get("created_at", ""))  # oldest first
-
-                if pending:
-                    if limit == "all":
-                        to_drop = pending[:]  # ALL undropped glazes
-                    else:
-                        to_drop = pending[: min(int(limit), len(pending))]
+                # oldest first; "all" drops ALL undropped glazes
+                to_drop = oldest_pending(data, None if limit == "all" else int(limit))
 
-                    for g in to_drop:
-                        await _drop_one_glaze(drop_ch, guild, g)
-                        g["dropped_at"] = iso_utc(now_utc())
+                for g in to_drop:
+                    await _drop_one_glaze(drop_ch, guild, g)
+                    g["dropped_at"] = iso_utc(now_utc())
 
                 # mark today's daily drop as done (ONLY the scheduler does this)
                 data["meta"]["last_daily_drop_date"] = today_str
-                await save_data(data, sha, message="Daily glaze drop")
+                mark_dirty("Daily glaze drop")
 
         # monthly drop
-        if is_last_day_of_month_london(now_ldn) and now_ldn.hour == MONTHLY_DROP_HOUR and now_ldn.minute == MONTHLY_DROP_MINUTE:
-            mk = now_ldn.strftime("%Y-%m")
+        if is_last_day_of_month_london(now_ldn) and (now_ldn.hour, now_ldn.minute) >= (MONTHLY_DROP_HOUR, MONTHLY_DROP_MINUTE):
+            mk = month_key(now_ldn)
             already = data["meta"].get("last_monthly_announce", {}).get(mk)
             if not already:
                 winner = compute_month_winner(data, mk)
                 if winner:
                     winner_id, count = winner
-                    await drop_ch.send(f"{MONTHLY_PING_PREFIX}\n@everyone")
-                    await drop_ch.send(embed=build_monthly_embed(mk, f"<@{winner_id}>", count))
+                    await drop_ch.send(f"{MONTHLY_PING_PREFIX}\n@everyone", embed=build_monthly_embed(mk, f"<@{winner_id}>", count))
 
                     data["meta"]["last_monthly_announce"][mk] = iso_utc(now_utc())
-                    data["wins"][str(winner_id)] = int(data["wins"].get(str(winner_id), 0)) + 1
-                    await save_data(data, sha, message=f"Monthly most glazed {mk}")
+                    data["wins"][winner_id] = data["wins"].get(winner_id, 0) + 1
+                    mark_dirty(f"Monthly most glazed {mk}")
 
     except Exception as e:
         print("Scheduler error:", repr(e))